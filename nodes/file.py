@@ -6,6 +6,7 @@ except ImportError:
 
 import json
 import os
+import stat
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -324,24 +325,28 @@ class FileListNode(Node):
             
             # Filter and format the results
             for path in paths:
-                if path.is_dir() and not include_dirs:
+                # One stat() per entry instead of separate is_dir/is_file/stat calls
+                stats = path.stat()
+                is_dir = stat.S_ISDIR(stats.st_mode)
+                if is_dir and not include_dirs:
                     continue
                     
                 file_info = {
                     "path": str(path),
                     "name": path.name,
-                    "is_dir": path.is_dir(),
-                    "size": path.stat().st_size if path.is_file() else 0,
-                    "modified": path.stat().st_mtime
+                    "is_dir": is_dir,
+                    "size": stats.st_size if stat.S_ISREG(stats.st_mode) else 0,
+                    "modified": stats.st_mtime
                 }
                 file_list.append(file_info)
             
-            workflow_logger.info(f"Found {len(file_list)} files/directories")
+            count = len(file_list)
+            workflow_logger.info(f"Found {count} files/directories")
             
             return {
                 "success": "true",
                 "files": json.dumps(file_list, indent=2),
-                "count": len(file_list),
+                "count": count,
                 "error_message": ""
             }
             
@@ -4,10 +4,84 @@ try:
 except ImportError:
     from stub import Node, register_node, get_api_key
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
+from functools import lru_cache
 import datetime
+import re
+import sys
 import time
-import pytz
+
+try:
+    from zoneinfo import ZoneInfo as _ZoneInfo, ZoneInfoNotFoundError, available_timezones
+    # ZoneInfo raises ValueError for malformed keys such as '' or '../x'
+    _UNKNOWN_TZ_ERRORS = (ZoneInfoNotFoundError, ValueError)
+except ImportError:
+    import pytz
+    _ZoneInfo = pytz.timezone
+    _UNKNOWN_TZ_ERRORS = (pytz.exceptions.UnknownTimeZoneError,)
+    available_timezones = lambda: set(pytz.all_timezones)
+
+
+# Bound once to avoid repeated module attribute lookups on every call
+_UTC = datetime.timezone.utc
+_DT = datetime.datetime
+_FROM_TS = _DT.fromtimestamp
+_FROM_ISO = _DT.fromisoformat
+_STRPTIME = _DT.strptime
+
+# Numeric inputs are treated as Unix timestamps
+_NUM_RE = re.compile(r'^-?\d+(\.\d+)?$')
+# Fallback formats for non-ISO input, selected by shape so strptime runs once
+_FMT_DETECT = (
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{1,2}:\d{1,2}$'), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'), "%Y-%m-%d"),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{1,2}:\d{1,2}$'), "%m/%d/%Y %H:%M:%S"),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), "%m/%d/%Y"),
+)
+# datetime.fromisoformat accepts a trailing 'Z' natively since Python 3.11
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+# C-level equivalents of common strftime patterns, used instead of strftime
+_FMT_FASTPATHS = {
+    "%Y-%m-%d %H:%M:%S": lambda dt: dt.isoformat(sep=' ', timespec='seconds')[:19],
+    "%Y-%m-%dT%H:%M:%S": lambda dt: dt.isoformat(timespec='seconds')[:19],
+    "%Y-%m-%d": lambda dt: dt.date().isoformat(),
+}
+# Lower-cased IANA names that are plain UTC; resolved to the _UTC singleton so
+# the conversion can be skipped by an identity check
+_UTC_NAMES = frozenset({"utc", "etc/utc", "uct", "etc/uct", "universal", "etc/universal", "zulu", "etc/zulu"})
+# Seconds per supported TimeDifferenceNode result unit
+_UNIT_DIVISORS = {"seconds": 1.0, "minutes": 60.0, "hours": 3600.0, "days": 86400.0}
+# Pre-bound formatters for each unit's human-readable difference
+_UNIT_FMT = {unit: ("{:.2f} " + unit).format for unit in _UNIT_DIVISORS}
+
+
+def _epoch(value: Union[float, datetime.datetime]) -> float:
+    return value.timestamp() if isinstance(value, _DT) else value
+
+def _err(msg: str) -> Dict[str, Any]:
+    """Build the failure result shared by the time nodes"""
+    return {"success": False, "error_message": msg}
+
+
+@lru_cache(maxsize=1)
+def _timezone_names_by_lower() -> Dict[str, str]:
+    """Map lower-cased IANA names to their canonical spelling (built on first use)"""
+    return {tz_name.lower(): tz_name for tz_name in available_timezones()}
+
+
+@lru_cache(maxsize=None)
+def _load_timezone(name: str):
+    """Return the (cached) tzinfo for a canonically spelled timezone name"""
+    return _ZoneInfo(name)
+
+
+def _get_timezone(name: str):
+    """Return the tzinfo for a timezone name, matched case-insensitively like pytz"""
+    lowered = name.lower()
+    if lowered in _UTC_NAMES:
+        return _UTC
+    # Resolve the canonical spelling first so every casing shares one cache entry
+    return _load_timezone(_timezone_names_by_lower().get(lowered, name))
 
 
 @register_node
@@ -16,19 +90,22 @@ class TimeNode(Node):
     NAME = "Current Time"
     DESCRIPTION = "Get the current time with formatting options and timezone support"
 
+    _DEFAULT_FMT = "%Y-%m-%d %H:%M:%S"
+    _DEFAULT_TZ = "UTC"
+
     INPUTS = {
         "format_string": {
             "label": "Format String",
             "description": "Python datetime format string (e.g. '%Y-%m-%d %H:%M:%S')",
             "type": "STRING",
-            "default": "%Y-%m-%d %H:%M:%S",
+            "default": _DEFAULT_FMT,
             "required": False,
         },
         "timezone": {
             "label": "Timezone",
             "description": "Timezone name (e.g. 'UTC', 'America/New_York', 'Asia/Shanghai')",
             "type": "STRING",
-            "default": "UTC",
+            "default": _DEFAULT_TZ,
             "required": False,
         }
     }
@@ -66,35 +143,42 @@ class TimeNode(Node):
             workflow_logger.info("Getting current time")
             
             # Get input parameters with defaults
-            format_string = node_inputs.get("format_string", "%Y-%m-%d %H:%M:%S")
-            timezone_name = node_inputs.get("timezone", "UTC")
+            format_string = node_inputs.get("format_string") or self._DEFAULT_FMT
+            timezone_name = node_inputs.get("timezone") or self._DEFAULT_TZ
             
-            # Get current UTC time
-            utc_now = datetime.datetime.now(datetime.timezone.utc)
-            timestamp = utc_now.timestamp()
+            # Get current UTC time, building the datetime from the raw timestamp
+            timestamp = time.time()
+            utc_now = _FROM_TS(timestamp, tz=_UTC)
             
             # Convert to specified timezone if provided
             try:
-                timezone = pytz.timezone(timezone_name)
-                current_time = utc_now.astimezone(timezone)
-                workflow_logger.debug(f"Converted time to timezone: {timezone_name}")
-            except pytz.exceptions.UnknownTimeZoneError:
-                workflow_logger.warning(f"Unknown timezone: {timezone_name}, using UTC")
+                timezone = _get_timezone(timezone_name)
+                if timezone is _UTC:
+                    current_time = utc_now
+                else:
+                    current_time = utc_now.astimezone(timezone)
+                workflow_logger.debug("Converted time to timezone: %s", timezone_name)
+            except _UNKNOWN_TZ_ERRORS:
+                workflow_logger.warning("Unknown timezone: %s, using UTC", timezone_name)
                 current_time = utc_now
                 timezone_name = "UTC"
             
             # Format the time according to the format string
             try:
-                formatted_time = current_time.strftime(format_string)
-                workflow_logger.debug(f"Formatted time with pattern: {format_string}")
+                fast_format = _FMT_FASTPATHS.get(format_string)
+                if fast_format is not None:
+                    formatted_time = fast_format(current_time)
+                else:
+                    formatted_time = current_time.strftime(format_string)
+                workflow_logger.debug("Formatted time with pattern: %s", format_string)
             except ValueError as e:
-                workflow_logger.warning(f"Invalid format string: {format_string}, using default")
-                formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
+                workflow_logger.warning("Invalid format string: %s, using default", format_string)
+                formatted_time = _FMT_FASTPATHS[self._DEFAULT_FMT](current_time)
             
             # Get ISO format
             iso_format = current_time.isoformat()
             
-            workflow_logger.info(f"Current time in {timezone_name}: {formatted_time}")
+            workflow_logger.info("Current time in %s: %s", timezone_name, formatted_time)
             
             return {
                 "success": True,
@@ -107,10 +191,7 @@ class TimeNode(Node):
         except Exception as e:
             error_msg = f"Error getting current time: {str(e)}"
             workflow_logger.error(error_msg)
-            return {
-                "success": False,
-                "error_message": error_msg
-            }
+            return _err(error_msg)
 
 
 @register_node
@@ -119,6 +200,8 @@ class TimeDifferenceNode(Node):
     NAME = "Time Difference"
     DESCRIPTION = "Calculate the difference between two times or dates"
 
+    _DEFAULT_UNIT = "seconds"
+
     INPUTS = {
         "start_time": {
             "label": "Start Time",
@@ -136,7 +219,7 @@ class TimeDifferenceNode(Node):
             "label": "Result Unit",
             "description": "Unit for the result (seconds, minutes, hours, days)",
             "type": "STRING",
-            "default": "seconds",
+            "default": _DEFAULT_UNIT,
             "required": False,
         }
     }
@@ -171,52 +254,37 @@ class TimeDifferenceNode(Node):
             # Get input parameters
             start_time_str = node_inputs.get("start_time")
             end_time_str = node_inputs.get("end_time")
-            unit = node_inputs.get("unit", "seconds").lower()
+            unit = (node_inputs.get("unit") or self._DEFAULT_UNIT).lower()
+            if unit not in _UNIT_DIVISORS:
+                # Default to seconds if unit not recognized
+                workflow_logger.warning("Unrecognized unit: %s, using seconds", unit)
+                unit = self._DEFAULT_UNIT
             
             # Parse start time
-            start_datetime = self._parse_time_input(start_time_str, workflow_logger)
-            if not start_datetime:
-                return {
-                    "success": False,
-                    "error_message": f"Invalid start time format: {start_time_str}"
-                }
+            start_value = self._parse_time_value(start_time_str, workflow_logger)
+            if start_value is None:
+                return _err(f"Invalid start time format: {start_time_str}")
             
             # Parse end time (default to current time if not provided)
             if end_time_str:
-                end_datetime = self._parse_time_input(end_time_str, workflow_logger)
-                if not end_datetime:
-                    return {
-                        "success": False,
-                        "error_message": f"Invalid end time format: {end_time_str}"
-                    }
+                end_value = self._parse_time_value(end_time_str, workflow_logger)
+                if end_value is None:
+                    return _err(f"Invalid end time format: {end_time_str}")
             else:
-                end_datetime = datetime.datetime.now(datetime.timezone.utc)
+                end_value = time.time()
             
-            # Calculate difference in seconds
-            difference_seconds = (end_datetime - start_datetime).total_seconds()
+            # Calculate difference in seconds; subtracting datetimes keeps
+            # microsecond precision that rounded epoch floats lose
+            if isinstance(start_value, _DT) and isinstance(end_value, _DT):
+                difference_seconds = (end_value - start_value).total_seconds()
+            else:
+                difference_seconds = _epoch(end_value) - _epoch(start_value)
             
             # Convert to requested unit
-            formatted_difference = ""
-            if unit == "seconds":
-                difference = difference_seconds
-                formatted_difference = f"{difference:.2f} seconds"
-            elif unit == "minutes":
-                difference = difference_seconds / 60
-                formatted_difference = f"{difference:.2f} minutes"
-            elif unit == "hours":
-                difference = difference_seconds / 3600
-                formatted_difference = f"{difference:.2f} hours"
-            elif unit == "days":
-                difference = difference_seconds / 86400
-                formatted_difference = f"{difference:.2f} days"
-            else:
-                # Default to seconds if unit not recognized
-                workflow_logger.warning(f"Unrecognized unit: {unit}, using seconds")
-                unit = "seconds"
-                difference = difference_seconds
-                formatted_difference = f"{difference:.2f} seconds"
+            difference = difference_seconds / _UNIT_DIVISORS[unit]
+            formatted_difference = _UNIT_FMT[unit](difference)
             
-            workflow_logger.info(f"Time difference: {formatted_difference}")
+            workflow_logger.info("Time difference: %s", formatted_difference)
             
             return {
                 "success": True,
@@ -228,60 +296,89 @@ class TimeDifferenceNode(Node):
         except Exception as e:
             error_msg = f"Error calculating time difference: {str(e)}"
             workflow_logger.error(error_msg)
-            return {
-                "success": False,
-                "error_message": error_msg
-            }
+            return _err(error_msg)
     
-    def _parse_time_input(self, time_input: str, logger) -> datetime.datetime:
+    def _parse_time_value(self, time_input: str, logger) -> Optional[Union[float, datetime.datetime]]:
         """
-        Parse a time input string into a datetime object
+        Parse a time input into epoch seconds or a datetime
+        
+        Numeric timestamps are returned as floats without building a datetime;
+        time strings are returned as timezone-aware datetimes.
         
         Args:
-            time_input: Time string in various formats
+            time_input: Timestamp (number or numeric string) or time string in various formats
             logger: Logger instance
             
         Returns:
-            datetime object or None if parsing fails
+            Epoch seconds, datetime object, or None if parsing fails
         """
         try:
-            # Try parsing as timestamp (float)
-            try:
-                timestamp = float(time_input)
-                return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
-            except ValueError:
-                # Not a timestamp, continue to other formats
-                pass
+            if isinstance(time_input, bool):
+                raise TypeError("boolean is not a valid time input")
             
-            # Try parsing as ISO format
-            try:
-                return datetime.datetime.fromisoformat(time_input.replace('Z', '+00:00'))
-            except ValueError:
-                # Not ISO format, try other common formats
-                pass
+            if isinstance(time_input, str):
+                time_input = time_input.strip()
+                if not _NUM_RE.match(time_input):
+                    dt = self._parse_time_input(time_input)
+                    if dt is not None:
+                        return dt
             
-            # Try common formats
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y"]:
-                try:
-                    dt = datetime.datetime.strptime(time_input, fmt)
-                    # Add UTC timezone if not present
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=datetime.timezone.utc)
-                    return dt
-                except ValueError:
-                    continue
+            # Numeric timestamps, including strings the regex doesn't cover
+            # ('1.7e9', '+1700000000', '.5')
+            timestamp = float(time_input)
+            # fromtimestamp rejects nan/inf and out-of-range values
+            _FROM_TS(timestamp, tz=_UTC)
+            return timestamp
             
-            # If all parsing attempts fail
-            logger.error(f"Failed to parse time input: {time_input}")
+        except (OverflowError, OSError, ValueError):
+            logger.error("Failed to parse time input: %s", time_input)
             return None
-            
         except Exception as e:
-            logger.error(f"Error parsing time input: {str(e)}")
+            logger.error("Error parsing time input: %s", e)
             return None
+    
+    def _parse_time_input(self, time_input: str) -> Optional[datetime.datetime]:
+        """
+        Parse a non-numeric time string into a datetime object
+        
+        Args:
+            time_input: Stripped time string in ISO 8601 or a common date format
+            
+        Returns:
+            Timezone-aware datetime object or None if the format is not recognized
+        """
+        # Try parsing as ISO format
+        iso_input = time_input
+        if not _ISO_ACCEPTS_Z and time_input.endswith('Z'):
+            iso_input = time_input[:-1] + '+00:00'
+        try:
+            dt = _FROM_ISO(iso_input)
+        except ValueError:
+            dt = None
+        
+        # Try common formats
+        if dt is None:
+            for pattern, fmt in _FMT_DETECT:
+                if pattern.match(time_input):
+                    try:
+                        dt = _STRPTIME(time_input, fmt)
+                    except ValueError:
+                        # Right shape but out-of-range values
+                        pass
+                    break
+        
+        if dt is None:
+            return None
+        
+        # Add UTC timezone if not present
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=_UTC)
+        return dt
 
 
 if __name__ == "__main__":
     # Setup basic logging
+    import asyncio
     import logging
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
@@ -289,15 +386,15 @@ if __name__ == "__main__":
     # Test TimeNode
     print("\n1. Testing TimeNode:")
     node1 = TimeNode()
-    result1 = node1.execute({}, logger)
+    result1 = asyncio.run(node1.execute({}, logger))
     print(f"Current Time Result: {result1}")
     
     # Test with custom format and timezone
     print("\n2. Testing TimeNode with custom format and timezone:")
-    result2 = node1.execute({
+    result2 = asyncio.run(node1.execute({
         "format_string": "%Y-%m-%d %H:%M:%S %Z",
         "timezone": "America/New_York"
-    }, logger)
+    }, logger))
     print(f"Formatted Time Result: {result2}")
     
     # Test TimeDifferenceNode
@@ -305,8 +402,17 @@ if __name__ == "__main__":
     node2 = TimeDifferenceNode()
     # Calculate difference between a timestamp from an hour ago and now
     one_hour_ago = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
-    result3 = node2.execute({
+    result3 = asyncio.run(node2.execute({
         "start_time": one_hour_ago.isoformat(),
         "unit": "minutes"
-    }, logger)
+    }, logger))
     print(f"Time Difference Result: {result3}")
+    
+    # Test TimeDifferenceNode with numeric timestamps (e.g. TimeNode's FLOAT output)
+    print("\n4. Testing TimeDifferenceNode with numeric timestamps:")
+    result4 = asyncio.run(node2.execute({
+        "start_time": 1700000000,
+        "end_time": 1700000060
+    }, logger))
+    assert result4["success"] and result4["difference"] == 60.0, result4
+    print(f"Numeric Time Difference Result: {result4}")
@@ -55,9 +55,7 @@ class PDFReader(FileReader):
                 pdf = pypdf.PdfReader(f)
                 
                 # Extract text from all pages
-                content = ""
-                for page in pdf.pages:
-                    content += page.extract_text() + "\n\n"
+                content = "".join(page.extract_text() + "\n\n" for page in pdf.pages)
                 
                 # Create metadata
                 metadata = {
@@ -131,10 +131,7 @@ class DocxReader(BaseWordReader):
                 raise ValueError(f"Invalid or corrupted .docx document: {file_path}") from e
             
             # Extract text from all paragraphs
-            content = ""
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    content += para.text + "\n\n"
+            content = "".join(para.text + "\n\n" for para in doc.paragraphs if para.text.strip())
             
             # Include headers if requested
             if include_headers:
@@ -213,10 +210,8 @@ class DocReader(BaseWordReader):
             
             try:
                 # Extract text content
-                content = ""
-                for para in doc.Paragraphs:
-                    if para.Range.Text.strip():
-                        content += para.Range.Text.strip() + "\n\n"
+                paragraphs = (para.Range.Text.strip() for para in doc.Paragraphs)
+                content = "".join(text + "\n\n" for text in paragraphs if text)
                 
                 # Include headers if requested
                 if include_headers: